@@ -1,56 +1,128 @@
 """ARES API client implementation with full endpoint support."""
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, List, Union
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Literal, Optional, List, Tuple, Union, overload
 from enum import Enum
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from . import __version__
+from .batcher import IcoBatcher
+from .cache import CacheBackend, TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+class AresApiError(Exception):
+    """Error response returned by ARES API."""
+    
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _dumps(obj: Any, *, pretty: bool = True) -> str:
+    """Serialize tool result to JSON text, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Exactly 8 ASCII digits (\d would also match non-ASCII digits)
+_ICO_RE = re.compile(r"\A[0-9]{8}\Z")
+
+_ICO_FORMAT_ERROR = "IČO musí být přesně 8 číslic"
+
+
+def _is_ico_format(ico: Any) -> bool:
+    """Check that IČO is a string of exactly 8 ASCII digits."""
+    return isinstance(ico, str) and _ICO_RE.match(ico) is not None
+
+
+def _ico_checksum_valid(ico: str) -> bool:
+    """Check IČO modulo 11 check digit.
+    
+    Expects exactly 8 ASCII digits. Works on the encoded bytes with the
+    weights 8..2 unrolled, so no per-digit strings or ints are created.
+    """
+    b = ico.encode("ascii")
+    total = ((b[0] - 48) * 8 + (b[1] - 48) * 7 + (b[2] - 48) * 6
+             + (b[3] - 48) * 5 + (b[4] - 48) * 4 + (b[5] - 48) * 3
+             + (b[6] - 48) * 2)
+    return (11 - total % 11) % 10 == b[7] - 48
+
+
 class RateLimiter:
-    """Simple rate limiter for API requests."""
+    """Token bucket rate limiter for API requests.
+    
+    The bucket holds up to ``burst`` tokens (``max_requests`` by default) and
+    refills continuously at ``max_requests / time_window`` tokens per second.
+    A lower ``burst`` smooths traffic into a steady drip instead of letting
+    a full window of requests through at once.
+    """
     
-    def __init__(self, max_requests: int = 100, time_window: int = 60):
+    def __init__(self, max_requests: int = 100, time_window: int = 60,
+                 burst: Optional[int] = None):
         self.max_requests = max_requests
         self.time_window = time_window  # seconds
-        self.requests: List[datetime] = []
+        self.burst = burst or max_requests
+        self.rate = max_requests / time_window  # tokens per second
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Wait if necessary to respect rate limits."""
         while True:
-            wait_time = 0
             async with self._lock:
-                now = datetime.now()
-                # Remove old requests outside the time window
-                self.requests = [
-                    req_time for req_time in self.requests
-                    if now - req_time < timedelta(seconds=self.time_window)
-                ]
+                now = time.monotonic()
+                # Refill lazily based on the time since the last acquire
+                self.tokens = min(
+                    self.burst,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
                 
-                if len(self.requests) >= self.max_requests:
-                    # Calculate wait time
-                    oldest_request = self.requests[0]
-                    wait_time = (oldest_request + timedelta(seconds=self.time_window) - now).total_seconds()
-                    if wait_time <= 0:
-                        # Window has passed, we can proceed
-                        self.requests.append(now)
-                        return
-                    else:
-                        logger.info(f"Rate limit reached, waiting {wait_time:.1f} seconds")
-                else:
-                    self.requests.append(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
                     return
+                
+                # Calculate wait time until the next token is available
+                wait_time = (1 - self.tokens) / self.rate
+                logger.info("Rate limit reached, waiting %.1f seconds", wait_time)
             
-            # Sleep outside the lock if we need to wait
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+            # Sleep outside the lock so other callers are not blocked
+            await asyncio.sleep(wait_time)
+    
+    def reset(self):
+        """Refill the bucket, discarding requests made so far."""
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
 
 
 class SortOrder(str, Enum):
@@ -74,28 +146,61 @@ class AddressFilter(BaseModel):
     textovaAdresa: Optional[str] = Field(None, description="Text address for searching")
 
 
-class ComplexSearchFilter(BaseModel):
-    """Complex search filter for economic entities."""
-    start: int = Field(0, ge=0, description="Starting position")
-    pocet: int = Field(20, ge=0, le=200, description="Number of results")
-    razeni: Optional[List[str]] = Field(None, description="Sort order")
-    ico: Optional[List[str]] = Field(None, description="List of ICOs")
-    obchodniJmeno: Optional[str] = Field(None, description="Business name")
-    sidlo: Optional[AddressFilter] = Field(None, description="Address filter")
-    pravniForma: Optional[List[str]] = Field(None, description="Legal form codes")
-    financniUrad: Optional[List[str]] = Field(None, description="Tax office codes")
-    czNace: Optional[List[str]] = Field(None, description="CZ-NACE codes", max_length=5)
+# Compiled once and reused for every search with an address filter
+_ADDRESS_ADAPTER = TypeAdapter(AddressFilter)
+
 
+# Optional filters passed through to search request bodies
+_BASIC_SEARCH_KEYS = ("razeni", "ico", "obchodniJmeno", "sidlo", "pravniForma")
+_COMPLEX_SEARCH_KEYS = _BASIC_SEARCH_KEYS + ("financniUrad", "czNace")
 
-class BasicSearchFilter(BaseModel):
-    """Basic search filter for registries."""
-    start: int = Field(0, ge=0)
-    pocet: int = Field(20, ge=0, le=200)
-    razeni: Optional[List[str]] = Field(None)
-    ico: Optional[List[str]] = Field(None)
-    obchodniJmeno: Optional[str] = Field(None)
-    sidlo: Optional[AddressFilter] = Field(None)
-    pravniForma: Optional[List[str]] = Field(None)
+
+def _as_list(value: Any) -> List[Any]:
+    """Wrap single value in a list, leave lists as they are.
+    
+    Tuples are converted to lists, since the JSON body expects an array.
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    return [value]
+
+
+# Limits ARES enforces on search requests, checked before sending
+_MAX_SEARCH_RESULTS = 200
+_MAX_CZ_NACE = 5
+
+
+def _build_search_body(filters: Dict[str, Any],
+                       keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build search request body from tool arguments.
+    
+    Builds the JSON dict directly instead of going through pydantic
+    models; paging, the CZ-NACE count and the address filter are
+    validated locally so malformed input does not cost an API request.
+    """
+    start = filters.get("start", 0)
+    pocet = filters.get("pocet", 20)
+    if start < 0:
+        raise ValueError("start must be >= 0")
+    if not 0 <= pocet <= _MAX_SEARCH_RESULTS:
+        raise ValueError(f"pocet must be between 0 and {_MAX_SEARCH_RESULTS}")
+    
+    body: Dict[str, Any] = {"start": start, "pocet": pocet}
+    for key in keys:
+        value = filters.get(key)
+        if value:
+            body[key] = value
+    
+    if "ico" in body:
+        body["ico"] = _as_list(body["ico"])
+    if len(body.get("czNace", ())) > _MAX_CZ_NACE:
+        raise ValueError(f"czNace accepts at most {_MAX_CZ_NACE} codes")
+    if "sidlo" in body:
+        address = _ADDRESS_ADAPTER.validate_python(body["sidlo"])
+        body["sidlo"] = _ADDRESS_ADAPTER.dump_python(address, exclude_none=True)
+    return body
 
 
 class AresApiClient:
@@ -103,6 +208,22 @@ class AresApiClient:
     
     BASE_URL = "https://ares.gov.cz/ekonomicke-subjekty-v-be/rest"
     
+    # Response cache TTLs in seconds: entity lookups change rarely,
+    # search results are cached only briefly
+    CACHE_TTL_LOOKUP = 3600
+    CACHE_TTL_SEARCH = 60
+    
+    # Expired responses older than this are not served during outages
+    MAX_STALE_AGE = 24 * 3600
+    
+    # Retry policy for throttled (429) and transient server errors
+    RETRY_STATUS_CODES = (429, 502, 503, 504)
+    MAX_RETRIES = 3
+    MAX_RETRY_DELAY = 30.0
+    
+    # Maximum concurrent lookups in bulk validation
+    BULK_CONCURRENCY = 20
+    
     # Registry information
     REGISTRIES = {
         "vr": {
@@ -152,61 +273,255 @@ class AresApiClient:
         }
     }
     
+    # URL prefix for each registry, built once at class creation
+    _REG_URLS = {key: f"/{info['endpoint']}" for key, info in REGISTRIES.items()}
+    
     def __init__(self, 
                  rate_limit_requests: int = 100, 
                  rate_limit_window: int = 60,
-                 auth_token: Optional[str] = None):
+                 auth_token: Optional[str] = None,
+                 rate_limit_burst: Optional[int] = None,
+                 cache: Optional[CacheBackend] = None,
+                 search_cache_ttl: Optional[int] = None,
+                 timeout: Optional[httpx.Timeout] = None,
+                 limits: Optional[httpx.Limits] = None,
+                 batch_window: float = 0.0):
         """Initialize ARES API client.
         
         Args:
             rate_limit_requests: Maximum requests per time window
             rate_limit_window: Time window in seconds
             auth_token: Optional authentication token
+            rate_limit_burst: Maximum burst size (defaults to rate_limit_requests)
+            cache: Response cache backend (defaults to in-memory TTLCache)
+            search_cache_ttl: Cache TTL for search results in seconds
+                (defaults to CACHE_TTL_SEARCH, 0 disables caching searches)
+            timeout: HTTP timeouts (defaults to 30 seconds)
+            limits: HTTP connection pool limits
+            batch_window: Seconds to collect concurrent single-ICO lookups
+                into one bulk search request (0 disables batching)
+        
+        Create one client and reuse it for all requests (e.g. with
+        ``async with AresApiClient() as client``); re-creating the client
+        per call loses all connection pooling benefit.
         """
+        # Content-Type is set by httpx only on requests with a JSON body
         headers = {
             "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "ARES-MCP-Server/0.3.2"
+            "User-Agent": f"ARES-MCP-Server/{__version__}"
         }
         
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
             
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers=headers,
-            timeout=30.0
+        self._headers = headers
+        self._timeout = timeout if timeout is not None else httpx.Timeout(30.0)
+        # ARES is a single host, so keep connections alive for reuse
+        self._limits = limits if limits is not None else httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = RateLimiter(
+            rate_limit_requests, rate_limit_window, burst=rate_limit_burst
         )
-        self.rate_limiter = RateLimiter(rate_limit_requests, rate_limit_window)
+        self.cache = cache if cache is not None else TTLCache()
+        if search_cache_ttl is not None:
+            self.CACHE_TTL_SEARCH = search_cache_ttl
+        self._inflight: Dict[str, "asyncio.Future[Union[Dict[str, Any], str]]"] = {}
+        self._batcher = IcoBatcher(
+            self._search_by_icos, max_wait=batch_window
+        ) if batch_window > 0 else None
+        
+        # Per-registry shortcuts with endpoints bound up front, e.g.
+        # vyhledat_v_rzp(filters) and najit_v_rzp(ico)
+        for key, info in self.REGISTRIES.items():
+            prefix = self._REG_URLS[key]
+            setattr(self, f"vyhledat_v_{key}", functools.partial(
+                self._vyhledat_v_registru, info, f"{prefix}/vyhledat"
+            ))
+            setattr(self, f"najit_v_{key}", functools.partial(
+                self._najit_v_registru, info, prefix
+            ))
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client, created on first use and re-created after close."""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent requests over one connection
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self._headers,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=True
+            )
+        return self._client
+    
+    def _cache_ttl(self, method: str, endpoint: str) -> int:
+        """Return cache TTL for endpoint, 0 if responses are not cached."""
+        if method == "GET":
+            return self.CACHE_TTL_LOOKUP
+        if method == "POST" and endpoint.endswith("/vyhledat"):
+            return self.CACHE_TTL_SEARCH
+        return 0
+    
+    @staticmethod
+    def _cache_key(method: str, endpoint: str, raw: bool, **kwargs) -> str:
+        """Build cache key from method, endpoint and request parameters."""
+        params = kwargs.get("params") or kwargs.get("json") or {}
+        key = f"{method}|{endpoint}|{raw}|{json.dumps(params, sort_keys=True)}"
+        return hashlib.sha256(key.encode()).hexdigest()
     
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make rate-limited HTTP request to ARES API."""
-        await self.rate_limiter.acquire()
+    def _stale_response(self, key: Optional[str]) -> Optional[Union[Dict[str, Any], str]]:
+        """Return last good cached response marked as stale, if any.
         
+        Raw responses are re-serialized with the marker added, so callers
+        passing the text through still see that the data is stale.
+        """
+        if key is None:
+            return None
+        cached = self.cache.get(
+            key, allow_stale=True, max_stale=self.MAX_STALE_AGE
+        )
+        if cached is None:
+            return None
+        logger.warning("ARES API unavailable, serving stale cached response")
+        if isinstance(cached, dict):
+            return {**cached, "stale": True}
+        
+        data = _loads(cached)
+        if isinstance(data, dict):
+            return _dumps({**data, "stale": True})
+        return _dumps({"stale": True, "data": data})
+    
+    @overload
+    async def _make_request(self, method: str, endpoint: str,
+                            raw: Literal[False] = False,
+                            **kwargs) -> Dict[str, Any]: ...
+    
+    @overload
+    async def _make_request(self, method: str, endpoint: str,
+                            raw: Literal[True], **kwargs) -> str: ...
+    
+    async def _make_request(self, method: str, endpoint: str, raw: bool = False,
+                            **kwargs) -> Union[Dict[str, Any], str]:
+        """Make rate-limited HTTP request to ARES API.
+        
+        With ``raw=True`` the JSON body is returned as text without being
+        parsed, for callers that pass the response through unchanged.
+        
+        Successful GET lookups and searches are cached, and concurrent
+        identical requests share a single upstream call. If the API fails
+        with a server error or is unreachable, the last cached response
+        (at most MAX_STALE_AGE past its TTL) is returned marked with
+        ``"stale": True``.
+        """
+        ttl = self._cache_ttl(method, endpoint)
+        if not ttl:
+            return await self._fetch(method, endpoint, raw, None, 0, **kwargs)
+        
+        key = self._cache_key(method, endpoint, raw, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Single-flight: later callers await the request already in progress
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(method, endpoint, raw, key, ttl, **kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, method: str, endpoint: str, raw: bool,
+                     key: Optional[str], ttl: int,
+                     **kwargs) -> Union[Dict[str, Any], str]:
+        """Perform HTTP request and store successful response in cache."""
         try:
-            response = await self.client.request(method, endpoint, **kwargs)
-            response.raise_for_status()
+            response = await self._send(method, endpoint, **kwargs)
             
             if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
+                result = response.text if raw else _loads(response.content)
             else:
-                return {"text": response.text}
+                result = {"text": response.text}
+                if raw:
+                    result = _dumps(result)
+            
+            if key is not None:
+                self.cache.set(key, result, ttl)
+            return result
                 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+            if e.response.status_code == 429 or e.response.status_code >= 500:
+                stale = self._stale_response(key)
+                if stale is not None:
+                    return stale
+            logger.error("HTTP error %s: %s", e.response.status_code, e.response.text)
             error_detail = f"HTTP {e.response.status_code}"
             try:
                 error_json = e.response.json()
-                if "detail" in error_json:
+                # Only JSON objects carry a detail field
+                if isinstance(error_json, dict) and "detail" in error_json:
                     error_detail += f": {error_json['detail']}"
-            except:
+            except ValueError:
                 if e.response.text:
                     error_detail += f": {e.response.text}"
-            raise Exception(f"ARES API error: {error_detail}")
+            raise AresApiError(
+                f"ARES API error: {error_detail}", e.response.status_code
+            )
+        except httpx.TransportError as e:
+            stale = self._stale_response(key)
+            if stale is not None:
+                return stale
+            logger.error("Request error: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise
     
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Return delay before retry, honoring the Retry-After header."""
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(self.MAX_RETRY_DELAY, max(0.0, delay))
+        
+        # Exponential backoff with jitter
+        backoff = min(self.MAX_RETRY_DELAY, 0.5 * 2 ** attempt)
+        return backoff + random.uniform(0, 0.25)
+    
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send HTTP request, retrying throttled and transient server errors."""
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            response = await self.client.request(method, endpoint, **kwargs)
+            
+            if (response.status_code not in self.RETRY_STATUS_CODES
+                    or attempt >= self.MAX_RETRIES):
+                response.raise_for_status()
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            logger.warning(
+                "HTTP %s from ARES, retrying in %.1f seconds",
+                response.status_code, delay
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+    
     # Main economic entities endpoints
     
     async def vyhledat_ekonomicke_subjekty(self, filters: Dict[str, Any]) -> str:
@@ -214,204 +529,244 @@ class AresApiClient:
         
         This is the main search endpoint for ARES.
         """
-        # Build request body
-        body = ComplexSearchFilter(
-            start=filters.get("start", 0),
-            pocet=filters.get("pocet", 20)
-        )
-        
-        if filters.get("razeni"):
-            body.razeni = filters["razeni"]
-        if filters.get("ico"):
-            body.ico = filters["ico"] if isinstance(filters["ico"], list) else [filters["ico"]]
-        if filters.get("obchodniJmeno"):
-            body.obchodniJmeno = filters["obchodniJmeno"]
-        if filters.get("sidlo"):
-            body.sidlo = AddressFilter(**filters["sidlo"])
-        if filters.get("pravniForma"):
-            body.pravniForma = filters["pravniForma"]
-        if filters.get("financniUrad"):
-            body.financniUrad = filters["financniUrad"]
-        if filters.get("czNace"):
-            body.czNace = filters["czNace"]
+        body = _build_search_body(filters, _COMPLEX_SEARCH_KEYS)
         
         try:
             result = await self._make_request(
                 "POST",
                 "/ekonomicke-subjekty/vyhledat",
-                json=body.model_dump(exclude_none=True)
+                json=body
             )
             
             # Format response
             if isinstance(result, dict):
-                return json.dumps({
+                formatted = {
                     "pocetCelkem": result.get("pocetCelkem", 0),
                     "ekonomickeSubjekty": result.get("ekonomickeSubjekty", [])
-                }, indent=2, ensure_ascii=False)
+                }
+                if result.get("stale"):
+                    formatted["stale"] = True
+                return _dumps(formatted)
             
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return _dumps(result)
             
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
     async def najit_ekonomicky_subjekt(self, ico: str) -> str:
         """Get economic entity by ICO."""
+        # Malformed ICO cannot exist, so don't spend a request on it
+        if not _is_ico_format(ico):
+            return _dumps({"error": _ICO_FORMAT_ERROR})
+        
         try:
-            result = await self._make_request(
-                "GET",
-                f"/ekonomicke-subjekty/{ico}"
-            )
-            
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return await self._lookup_subject(ico)
             
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
+    
+    async def _lookup_subject(self, ico: str) -> str:
+        """Fetch entity by ICO as JSON text, batching lookups if enabled."""
+        if self._batcher is None:
+            return await self._make_request(
+                "GET",
+                f"/ekonomicke-subjekty/{ico}",
+                raw=True
+            )
+        
+        subject = await self._batcher.get(ico)
+        if subject is None:
+            raise AresApiError(f"ARES API error: HTTP 404: IČO {ico} not found", 404)
+        return _dumps(subject)
+    
+    async def _search_by_icos(self, icos: List[str]) -> List[Dict[str, Any]]:
+        """Fetch entities for batch of ICOs with a single search request."""
+        result = await self._make_request(
+            "POST",
+            "/ekonomicke-subjekty/vyhledat",
+            json={"start": 0, "pocet": len(icos), "ico": icos}
+        )
+        return result.get("ekonomickeSubjekty", [])
     
     # Registry-specific endpoints
     
     async def vyhledat_v_registru(self, registry: str, filters: Dict[str, Any]) -> str:
         """Search in specific registry."""
-        if registry not in self.REGISTRIES:
-            return json.dumps({
+        info = self.REGISTRIES.get(registry)
+        if info is None:
+            return _dumps({
                 "error": f"Unknown registry: {registry}",
-                "available": list(self.REGISTRIES.keys())
-            }, indent=2)
-        
-        endpoint = f"/{self.REGISTRIES[registry]['endpoint']}/vyhledat"
+                "available": list(self.REGISTRIES)
+            })
         
-        # Build request body
-        body = BasicSearchFilter(
-            start=filters.get("start", 0),
-            pocet=filters.get("pocet", 20)
+        return await self._vyhledat_v_registru(
+            info, f"{self._REG_URLS[registry]}/vyhledat", filters
         )
+    
+    async def najit_v_registru(self, registry: str, ico: str) -> str:
+        """Get entity from specific registry by ICO."""
+        info = self.REGISTRIES.get(registry)
+        if info is None:
+            return _dumps({
+                "error": f"Unknown registry: {registry}",
+                "available": list(self.REGISTRIES)
+            })
         
-        if filters.get("razeni"):
-            body.razeni = filters["razeni"]
-        if filters.get("ico"):
-            body.ico = filters["ico"] if isinstance(filters["ico"], list) else [filters["ico"]]
-        if filters.get("obchodniJmeno"):
-            body.obchodniJmeno = filters["obchodniJmeno"]
-        if filters.get("sidlo"):
-            body.sidlo = AddressFilter(**filters["sidlo"])
-        if filters.get("pravniForma"):
-            body.pravniForma = filters["pravniForma"]
+        return await self._najit_v_registru(info, self._REG_URLS[registry], ico)
+    
+    async def _vyhledat_v_registru(self, info: Dict[str, str], endpoint: str,
+                                   filters: Dict[str, Any]) -> str:
+        """Search registry at already resolved endpoint."""
+        body = _build_search_body(filters, _BASIC_SEARCH_KEYS)
         
         try:
             result = await self._make_request(
                 "POST",
                 endpoint,
-                json=body.model_dump(exclude_none=True)
+                json=body
             )
             
-            return json.dumps({
-                "registry": self.REGISTRIES[registry],
+            return _dumps({
+                "registry": info,
                 "data": result
-            }, indent=2, ensure_ascii=False)
+            })
             
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
-    async def najit_v_registru(self, registry: str, ico: str) -> str:
-        """Get entity from specific registry by ICO."""
-        if registry not in self.REGISTRIES:
-            return json.dumps({
-                "error": f"Unknown registry: {registry}",
-                "available": list(self.REGISTRIES.keys())
-            }, indent=2)
-        
-        endpoint = f"/{self.REGISTRIES[registry]['endpoint']}/{ico}"
+    async def _najit_v_registru(self, info: Dict[str, str], prefix: str,
+                                ico: str) -> str:
+        """Get entity from registry at already resolved URL prefix."""
+        if not _is_ico_format(ico):
+            return _dumps({"error": _ICO_FORMAT_ERROR})
         
         try:
-            result = await self._make_request("GET", endpoint)
+            result = await self._make_request("GET", f"{prefix}/{ico}")
             
-            return json.dumps({
-                "registry": self.REGISTRIES[registry],
+            return _dumps({
+                "registry": info,
                 "data": result
-            }, indent=2, ensure_ascii=False)
+            })
             
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
     # Utility endpoints
     
     async def vyhledat_ciselniky(self, filters: Dict[str, Any]) -> str:
         """Search codebooks/nomenclatures."""
         try:
-            result = await self._make_request(
+            return await self._make_request(
                 "POST",
                 "/ciselniky-nazevniky/vyhledat",
-                json=filters
+                json=filters,
+                raw=True
             )
             
-            return json.dumps(result, indent=2, ensure_ascii=False)
-            
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
     async def vyhledat_adresy(self, filters: Dict[str, Any]) -> str:
         """Search standardized addresses."""
         try:
-            result = await self._make_request(
+            return await self._make_request(
                 "POST",
                 "/standardizovane-adresy/vyhledat",
-                json=filters
+                json=filters,
+                raw=True
             )
             
-            return json.dumps(result, indent=2, ensure_ascii=False)
-            
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
     async def vyhledat_notifikace(self, filters: Dict[str, Any]) -> str:
         """Search notification batches."""
         try:
-            result = await self._make_request(
+            return await self._make_request(
                 "POST",
                 "/ekonomicke-subjekty-notifikace/vyhledat",
-                json=filters
+                json=filters,
+                raw=True
             )
             
-            return json.dumps(result, indent=2, ensure_ascii=False)
-            
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
     
     async def validovat_ico(self, ico: str) -> str:
-        """Validate ICO format and existence."""
+        """Validate ICO format and existence.
+        
+        The existence lookup goes through the response cache, so repeated
+        validations of the same ICO do not hit ARES again within
+        CACHE_TTL_LOOKUP. With batching enabled (``batch_window > 0``) the
+        lookup is part of a bulk search instead, cached per batch for
+        CACHE_TTL_SEARCH.
+        """
+        return _dumps(await self._validovat_ico(ico))
+    
+    async def validovat_ico_hromadne(self, icos: List[str]) -> str:
+        """Validate multiple ICOs concurrently.
+        
+        Lookups run in parallel, bounded to stay within the rate limiter
+        burst so large batches do not trigger throttling on ARES.
+        """
+        semaphore = asyncio.Semaphore(
+            max(1, min(self.BULK_CONCURRENCY, self.rate_limiter.burst))
+        )
+        
+        async def validate_one(ico: str) -> Dict[str, Any]:
+            async with semaphore:
+                return {"ico": ico, **await self._validovat_ico(ico)}
+        
+        results = await asyncio.gather(*(validate_one(ico) for ico in icos))
+        return _dumps({
+            "pocetCelkem": len(results),
+            "pocetValidnich": sum(1 for result in results if result.get("valid")),
+            "vysledky": results
+        })
+    
+    async def _validovat_ico(self, ico: str) -> Dict[str, Any]:
+        """Validate ICO format and existence, returning result dict."""
         try:
             # ICO validation algorithm
-            if not ico or not ico.isdigit() or len(ico) != 8:
-                return json.dumps({
+            if not _is_ico_format(ico):
+                return {
                     "valid": False,
-                    "reason": "IČO musí být přesně 8 číslic"
-                }, indent=2)
+                    "reason": _ICO_FORMAT_ERROR
+                }
             
             # Check modulo 11 algorithm
-            weights = [8, 7, 6, 5, 4, 3, 2]
-            total = sum(int(ico[i]) * weights[i] for i in range(7))
-            check_digit = (11 - (total % 11)) % 10
-            
-            is_valid_format = check_digit == int(ico[7])
+            is_valid_format = _ico_checksum_valid(ico)
             
             # Check if exists
             exists = False
             if is_valid_format:
                 try:
-                    await self._make_request("GET", f"/ekonomicke-subjekty/{ico}")
+                    await self._lookup_subject(ico)
                     exists = True
-                except:
-                    exists = False
+                except AresApiError as e:
+                    # Only 404 means the subject does not exist
+                    if e.status_code != 404:
+                        raise
             
-            return json.dumps({
+            return {
                 "ico": ico,
                 "validFormat": is_valid_format,
                 "exists": exists,
                 "valid": is_valid_format and exists
-            }, indent=2)
+            }
             
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return {"error": str(e)}
     
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Close HTTP client and cancel batched lookups still in progress."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "AresApiClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Batching of single-IČO lookups into bulk ARES searches."""
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class IcoBatcher:
+    """Coalesce concurrent single-IČO lookups into one bulk request.
+
+    Lookups arriving within ``max_wait`` seconds of each other are
+    collected and fetched together (up to ``max_batch`` IČOs per request);
+    each caller then receives its own subject from the batch response.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]],
+                 max_batch: int = 200,
+                 max_wait: float = 0.02):
+        """Initialize batcher.
+
+        Args:
+            fetch: Coroutine returning subjects for a list of IČOs
+            max_batch: Maximum IČOs per bulk request
+            max_wait: Seconds to wait for more lookups before flushing
+        """
+        self._fetch = fetch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Strong references keep running batches from being garbage-collected
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def get(self, ico: str) -> Optional[Dict[str, Any]]:
+        """Return subject for IČO, or None if ARES does not know it."""
+        future = self._pending.get(ico)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[ico] = future
+
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Send all pending lookups as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(functools.partial(self._batch_done, batch))
+
+    def _batch_done(
+        self,
+        batch: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"],
+        task: "asyncio.Task[None]"
+    ) -> None:
+        """Drop finished batch task, cancelling lookups it left unresolved."""
+        self._tasks.discard(task)
+        for future in batch.values():
+            if not future.done():
+                future.cancel()
+
+    def cancel(self) -> None:
+        """Cancel pending and running batches and their waiting lookups."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        for future in batch.values():
+            future.cancel()
+        for task in self._tasks:
+            task.cancel()
+
+    async def _run_batch(
+        self, batch: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"]
+    ) -> None:
+        """Fetch batch and resolve each waiting lookup."""
+        try:
+            subjects = await self._fetch(list(batch))
+        except Exception as e:
+            logger.error("Batch lookup of %d IČOs failed: %s", len(batch), e)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_ico = {subject.get("ico"): subject for subject in subjects}
+        for ico, future in batch.items():
+            if not future.done():
+                future.set_result(by_ico.get(ico))
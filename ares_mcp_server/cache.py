@@ -0,0 +1,74 @@
+"""Response cache backends for ARES API client."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """Interface for response cache backends."""
+
+    @abstractmethod
+    def get(self, key: str, allow_stale: bool = False,
+            max_stale: Optional[float] = None) -> Optional[Any]:
+        """Return cached value for key, or None on miss.
+
+        Args:
+            key: Cache key
+            allow_stale: Also return entries whose TTL has already expired
+            max_stale: With ``allow_stale``, only return entries that expired
+                at most this many seconds ago (None means no limit)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        raise NotImplementedError
+
+
+class TTLCache(CacheBackend):
+    """In-memory LRU cache with per-entry expiry.
+
+    Expired entries are kept until evicted by LRU so they can still be
+    served as stale responses when the API is unavailable.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str, allow_stale: bool = False,
+            max_stale: Optional[float] = None) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        expired_for = time.monotonic() - expires_at
+        if expired_for >= 0:
+            if not allow_stale:
+                return None
+            if max_stale is not None and expired_for > max_stale:
+                return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
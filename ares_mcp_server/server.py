@@ -3,37 +3,96 @@
 import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import httpx
 from mcp.server import Server
-from mcp.server.models import InitializationOptions
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 
 from . import __version__
 from .api_client import AresApiClient
+from .cache import TTLCache
 from .tools import create_ares_tools
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SERVER_NAME = "ares-mcp-server"
+
+_ERROR_PREFIX = "Error: "
+
+
+def _ok(text: str) -> List[TextContent | ImageContent | EmbeddedResource]:
+    """Wrap tool result text as MCP content."""
+    return [TextContent(type="text", text=text)]
+
+
+# Tool name -> coroutine calling the matching API client method
+_DISPATCH: Dict[str, Callable[[AresApiClient, Dict[str, Any]], Awaitable[str]]] = {
+    # Main endpoints
+    "vyhledat_ekonomicke_subjekty": lambda client, args: client.vyhledat_ekonomicke_subjekty(args),
+    "najit_ekonomicky_subjekt": lambda client, args: client.najit_ekonomicky_subjekt(ico=args["ico"]),
+    # Registry endpoints
+    "vyhledat_v_registru": lambda client, args: client.vyhledat_v_registru(
+        registry=args["registry"],
+        filters={key: value for key, value in args.items() if key != "registry"}
+    ),
+    "najit_v_registru": lambda client, args: client.najit_v_registru(
+        registry=args["registry"], ico=args["ico"]
+    ),
+    # Utility endpoints
+    "validovat_ico": lambda client, args: client.validovat_ico(ico=args["ico"]),
+    "validovat_ico_hromadne": lambda client, args: client.validovat_ico_hromadne(icos=args["icos"]),
+    "vyhledat_ciselniky": lambda client, args: client.vyhledat_ciselniky(args),
+    "vyhledat_adresy": lambda client, args: client.vyhledat_adresy(args),
+    "vyhledat_notifikace": lambda client, args: client.vyhledat_notifikace(args),
+}
+
+# Required arguments per tool, checked before dispatch
+_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    tool.name: tuple(tool.inputSchema.get("required", ()))
+    for tool in create_ares_tools()
+}
+
 
 class AresMcpServer:
     """MCP Server for ARES API."""
     
-    def __init__(self):
-        self.server = Server("ares-mcp-server")
+    def __init__(self, api_client: Optional[AresApiClient] = None):
+        """Initialize MCP server.
         
-        # Get optional auth token from environment
-        auth_token = os.getenv("ARES_AUTH_TOKEN")
+        Args:
+            api_client: ARES API client (defaults to client with default settings)
+        """
+        self.server = Server(SERVER_NAME, version=__version__)
+        self.api_client = api_client if api_client is not None else AresApiClient()
         
-        # Initialize API client
-        self.api_client = AresApiClient(
+        self._setup_handlers()
+    
+    @classmethod
+    def from_env(cls) -> "AresMcpServer":
+        """Create server configured from ARES_* environment variables."""
+        api_client = AresApiClient(
             rate_limit_requests=int(os.getenv("ARES_RATE_LIMIT_REQUESTS", "100")),
             rate_limit_window=int(os.getenv("ARES_RATE_LIMIT_WINDOW", "60")),
-            auth_token=auth_token
+            rate_limit_burst=int(os.getenv("ARES_RATE_LIMIT_BURST", "0")) or None,
+            auth_token=os.getenv("ARES_AUTH_TOKEN"),
+            cache=TTLCache(maxsize=int(os.getenv("ARES_CACHE_SIZE", "1024"))),
+            search_cache_ttl=int(os.getenv("ARES_CACHE_TTL", "60")),
+            timeout=httpx.Timeout(
+                float(os.getenv("ARES_REQUEST_TIMEOUT", "30")),
+                connect=5.0,
+                pool=10.0
+            ),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("ARES_MAX_CONNECTIONS", "100")),
+                max_keepalive_connections=int(
+                    os.getenv("ARES_MAX_KEEPALIVE_CONNECTIONS", "20")
+                ),
+                keepalive_expiry=30.0
+            ),
+            batch_window=float(os.getenv("ARES_BATCH_WINDOW_MS", "0")) / 1000
         )
-        
-        self._setup_handlers()
+        return cls(api_client=api_client)
     
     def _setup_handlers(self):
         """Set up MCP protocol handlers."""
@@ -50,61 +109,21 @@ class AresMcpServer:
                 arguments = {}
             
             try:
-                # Main endpoints
-                if name == "vyhledat_ekonomicke_subjekty":
-                    result = await self.api_client.vyhledat_ekonomicke_subjekty(arguments)
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "najit_ekonomicky_subjekt":
-                    result = await self.api_client.najit_ekonomicky_subjekt(
-                        ico=arguments["ico"]
-                    )
-                    return [TextContent(type="text", text=result)]
-                
-                # Registry endpoints
-                elif name == "vyhledat_v_registru":
-                    registry = arguments.pop("registry")
-                    result = await self.api_client.vyhledat_v_registru(
-                        registry=registry,
-                        filters=arguments
-                    )
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "najit_v_registru":
-                    result = await self.api_client.najit_v_registru(
-                        registry=arguments["registry"],
-                        ico=arguments["ico"]
-                    )
-                    return [TextContent(type="text", text=result)]
+                handler = _DISPATCH.get(name)
+                if handler is None:
+                    raise ValueError(f"Unknown tool: {name}")
                 
-                # Utility endpoints
-                elif name == "validovat_ico":
-                    result = await self.api_client.validovat_ico(
-                        ico=arguments["ico"]
+                missing = [key for key in _REQUIRED.get(name, ()) if key not in arguments]
+                if missing:
+                    return _ok(
+                        f"{_ERROR_PREFIX}Missing required arguments: {', '.join(missing)}"
                     )
-                    return [TextContent(type="text", text=result)]
                 
-                elif name == "vyhledat_ciselniky":
-                    result = await self.api_client.vyhledat_ciselniky(arguments)
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "vyhledat_adresy":
-                    result = await self.api_client.vyhledat_adresy(arguments)
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "vyhledat_notifikace":
-                    result = await self.api_client.vyhledat_notifikace(arguments)
-                    return [TextContent(type="text", text=result)]
-                
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
+                return _ok(await handler(self.api_client, arguments))
                     
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}")
-                return [TextContent(
-                    type="text",
-                    text=f"Error: {str(e)}"
-                )]
+                logger.error("Error executing tool %s: %s", name, e)
+                return _ok(_ERROR_PREFIX + str(e))
     
     async def run(self):
         """Run the MCP server."""
@@ -112,22 +131,28 @@ class AresMcpServer:
         
         logger.info("Starting ARES MCP Server...")
         
-        async with stdio_server() as (read_stream, write_stream):
+        # One API client lives for the whole server run so its connection
+        # pool is shared by all tool calls
+        async with self.api_client, stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
-                InitializationOptions(
-                    server_name="ares-mcp-server",
-                    server_version=__version__,
-                    capabilities={}
-                )
+                self.server.create_initialization_options()
             )
 
 
 def main():
     """Main entry point."""
-    server = AresMcpServer()
-    asyncio.run(server.run())
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+    server = AresMcpServer.from_env()
+    
+    # Prefer uvloop's faster event loop when installed (ares-mcp-server[fast])
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(server.run())
+    else:
+        uvloop.run(server.run())
 
 
 if __name__ == "__main__":
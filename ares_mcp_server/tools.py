@@ -1,11 +1,17 @@
 """MCP tool definitions for ARES API."""
 
+from functools import lru_cache
 from typing import List
 from mcp.types import Tool
 
 
+@lru_cache(maxsize=1)
 def create_ares_tools() -> List[Tool]:
-    """Create and return ARES API tools for MCP."""
+    """Create and return ARES API tools for MCP.
+    
+    Tool definitions are static, so the list is built once and the same
+    list is returned on every call; callers must not mutate it.
+    """
     
     return [
         # Main search tool
@@ -181,6 +187,23 @@ def create_ares_tools() -> List[Tool]:
             }
         ),
         
+        # Validate multiple ICOs
+        Tool(
+            name="validovat_ico_hromadne",
+            description="Hromadné ověření validity IČO (Validate multiple ICOs at once)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "icos": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of IČO numbers to validate"
+                    }
+                },
+                "required": ["icos"]
+            }
+        ),
+        
         # Search codebooks
         Tool(
             name="vyhledat_ciselniky",
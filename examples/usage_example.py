@@ -2,56 +2,54 @@
 
 import asyncio
 import json
-from ares_mcp_server.api_client import AresAPIClient
+from ares_mcp_server.api_client import AresApiClient
 
 
 async def main():
     """Demonstrate ARES API client usage."""
-    client = AresAPIClient()
-    
-    try:
+    # One client for all calls so the HTTP connection pool is reused
+    async with AresApiClient() as client:
         print("=== ARES API Client Examples ===\n")
         
-        # Example 1: Search by company name
-        print("1. Searching for companies with 'Microsoft' in name:")
-        result = await client.search_subject(name="Microsoft")
-        print(result)
-        print()
+        # Independent calls run concurrently over the shared client
+        examples = [
+            # Example 1: Search by company name
+            ("1. Searching for companies with 'Microsoft' in name:",
+             client.vyhledat_ekonomicke_subjekty({
+                 "obchodniJmeno": "Microsoft",
+                 "pocet": 10
+             })),
+            # Example 2: Search by ICO
+            ("2. Searching for company with IČO 26168685:",
+             client.vyhledat_ekonomicke_subjekty({"ico": "26168685"})),
+            # Example 3: Search with multiple ICOs
+            ("3. Search with multiple ICOs:",
+             client.vyhledat_ekonomicke_subjekty({
+                 "ico": ["26168685", "00000019"],
+                 "pocet": 10
+             })),
+            # Example 4: Validate IČO
+            ("4. Validating IČO 00000019:",
+             client.validovat_ico("00000019")),
+            # Example 5: Get detailed information (will fail if IČO doesn't exist)
+            ("5. Getting details for IČO 26168685:",
+             client.najit_ekonomicky_subjekt("26168685")),
+        ]
         
-        # Example 2: Search by ICO
-        print("2. Searching for company with IČO 26168685:")
-        result = await client.search_subject(ico="26168685")
-        print(result)
-        print()
+        results = await asyncio.gather(
+            *(call for _, call in examples),
+            return_exceptions=True
+        )
         
-        # Example 3: Advanced search with multiple ICOs
-        print("3. Advanced search with multiple ICOs:")
-        result = await client.search_advanced({
-            "ico": ["26168685", "00000019"],
-            "count": 10
-        })
-        print(result)
-        print()
-        
-        # Example 4: Validate IČO
-        print("4. Validating IČO 00000019:")
-        result = await client.validate_ico("00000019")
-        print(result)
-        print()
-        
-        # Example 5: Get detailed information (will fail if IČO doesn't exist)
-        print("5. Getting details for IČO 26168685:")
-        result = await client.get_subject("26168685")
-        result_data = json.loads(result)
-        if "error" not in result_data:
-            print(json.dumps(result_data, indent=2, ensure_ascii=False))
-        else:
-            print(result)
-        print()
-        
-    finally:
-        await client.close()
+        for (title, _), result in zip(examples, results):
+            print(title)
+            if isinstance(result, Exception):
+                print(f"Error: {result}")
+            else:
+                # Pretty-print so raw pass-through responses are readable too
+                print(json.dumps(json.loads(result), indent=2, ensure_ascii=False))
+            print()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+"""Shared pytest configuration for ARES MCP Server tests."""
+
+import pytest
+from pytest_asyncio import plugin as pytest_asyncio_plugin
+
+# Run the test suite on uvloop when installed (ares-mcp-server[fast])
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Hook specs only exist on pytest-asyncio releases that have the hook
+_SPECS = getattr(pytest_asyncio_plugin, "PytestAsyncioSpecs", None)
+
+if uvloop is not None and hasattr(_SPECS, "pytest_asyncio_loop_factories"):
+    # pytest-asyncio 1.4 replaced the event_loop_policy override with this hook
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+elif uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        return uvloop.EventLoopPolicy()
@@ -1,191 +1,698 @@
 """Tests for ARES API client."""
 
+import asyncio
 import pytest
-import json
+from json import dumps
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-from ares_mcp_server.api_client import AresApiClient, RateLimiter
+import httpx
 
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads
 
-@pytest.mark.asyncio
-async def test_rate_limiter():
+from ares_mcp_server.api_client import AresApiClient, AresApiError, RateLimiter
+from ares_mcp_server.cache import CacheBackend
+
+# Mock ARES payloads shared by tests; tests must not mutate them
+_SEARCH_RESPONSE = {
+    "pocetCelkem": 1,
+    "ekonomickeSubjekty": [
+        {
+            "ico": "12345678",
+            "obchodniJmeno": "Test Company s.r.o.",
+            "sidlo": {
+                "nazevUlice": "Test Street",
+                "cisloDomovni": "123",
+                "nazevObce": "Prague",
+                "psc": "11000"
+            },
+            "pravniForma": "112",
+            "stavSubjektu": "AKTIVNI"
+        }
+    ]
+}
+
+# Entity lookups return the raw response body
+_ENTITY_RESPONSE = dumps({
+    "ico": "12345678",
+    "obchodniJmeno": "Test Company s.r.o.",
+    "sidlo": {
+        "nazevUlice": "Test Street",
+        "cisloDomovni": "123",
+        "nazevObce": "Prague"
+    }
+})
+
+_REGISTRY_RESPONSE = {
+    "pocetCelkem": 1,
+    "ekonomickeSubjekty": [{"ico": "12345678"}]
+}
+
+_EMPTY_SEARCH_RESPONSE = {"pocetCelkem": 0, "ekonomickeSubjekty": []}
+
+
+def _call(*args, **kwargs):
+    """Build the ``(args, kwargs)`` pair recorded by ``_RequestStub``."""
+    return args, kwargs
+
+
+class _RequestStub:
+    """Async stand-in for ``_make_request`` that records its calls.
+    
+    Each call is stored in ``calls`` as an ``(args, kwargs)`` pair. The stub
+    raises ``side_effect`` if set, otherwise returns ``return_value``.
+    """
+    
+    def __init__(self, return_value=None):
+        self.calls = []
+        self.return_value = return_value
+        self.side_effect = None
+    
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+@pytest.fixture(scope="session")
+async def ares_client():
+    """Client shared by all tests that need a default configuration."""
+    client = AresApiClient()
+    yield client
+    await client.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(ares_client):
+    """Drop state that would otherwise leak from one test into the next."""
+    yield
+    ares_client.cache.clear()
+    ares_client.rate_limiter.reset()
+
+
+@pytest.fixture
+def mocked_client(ares_client):
+    """Shared client with ``_make_request`` replaced by a recording stub."""
+    mock_request = _RequestStub()
+    ares_client._make_request = mock_request
+    yield ares_client, mock_request
+    del ares_client._make_request
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Simulated RateLimiter clock; returns the mocked ``asyncio.sleep``.
+    
+    Sleeping advances the clock instantly instead of waiting in real time.
+    """
+    now = [0.0]
+    
+    async def advance(delay):
+        now[0] += delay
+    
+    sleep = AsyncMock(side_effect=advance)
+    monkeypatch.setattr("ares_mcp_server.api_client.time",
+                        SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr("ares_mcp_server.api_client.asyncio.sleep", sleep)
+    return sleep
+
+
+async def test_rate_limiter(fake_clock):
     """Test rate limiter functionality."""
     limiter = RateLimiter(max_requests=2, time_window=0.5)  # Shorter window for testing
     
     # First two requests should go through immediately
     await limiter.acquire()
     await limiter.acquire()
+    fake_clock.assert_not_awaited()
     
-    # Third request should be delayed
-    import time
-    start = time.time()
+    # Third request should be delayed until a token is refilled
     await limiter.acquire()
-    elapsed = time.time() - start
     
-    # Should have waited approximately 0.5 seconds
-    assert elapsed >= 0.4  # Allow some margin
+    # Tokens refill at 2 per 0.5 seconds, so one token takes 0.25 seconds
+    fake_clock.assert_awaited_once()
+    assert fake_clock.await_args.args[0] == pytest.approx(0.25)
+    
+    # After a reset the full bucket is available again
+    limiter.reset()
+    fake_clock.reset_mock()
+    await limiter.acquire()
+    await limiter.acquire()
+    fake_clock.assert_not_awaited()
+
+
+async def test_rate_limiter_burst(fake_clock):
+    """Test that burst caps requests that pass without waiting."""
+    limiter = RateLimiter(max_requests=10, time_window=1, burst=1)
+    
+    await limiter.acquire()
+    
+    # Second request must wait for the drip rate (10 per second)
+    await limiter.acquire()
+    
+    fake_clock.assert_awaited_once()
+    assert fake_clock.await_args.args[0] == pytest.approx(0.1)
+
+
+async def test_rate_limiter_concurrent(fake_clock):
+    """Test that concurrent waiters do not sleep while holding the lock."""
+    limiter = RateLimiter(max_requests=2, time_window=0.5)
+    advance = fake_clock.side_effect
+    
+    async def sleep_unlocked(delay):
+        # A waiter sleeping inside the lock would block every other caller
+        assert not limiter._lock.locked()
+        await advance(delay)
+    
+    fake_clock.side_effect = sleep_unlocked
+    
+    # Two requests pass from the full bucket, the other two have to wait
+    await asyncio.gather(*[limiter.acquire() for _ in range(4)])
+    
+    fake_clock.assert_awaited()
+
+
+# Upper bound on the median uncontended acquire(); a correct limiter takes
+# around 10 microseconds, so this only fails on a gross hot-path regression
+_ACQUIRE_MEDIAN_LIMIT = 0.0005
+
+
+@pytest.mark.benchmark
+def test_rate_limiter_perf(request):
+    """Benchmark uncontended acquire() to catch slowdowns in the hot path.
+    
+    Deselected by default; run with ``pytest -m benchmark``.
+    """
+    pytest.importorskip("pytest_benchmark")
+    benchmark = request.getfixturevalue("benchmark")
+    
+    # Large bucket so the benchmark never has to wait for a refill
+    limiter = RateLimiter(max_requests=1_000_000, time_window=1)
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(limiter.acquire()),
+            rounds=2000,
+            warmup_rounds=10
+        )
+    finally:
+        loop.close()
+    
+    # Stats are not collected with --benchmark-disable
+    if benchmark.stats is not None:
+        assert benchmark.stats["median"] < _ACQUIRE_MEDIAN_LIMIT
 
 
-@pytest.mark.asyncio
-async def test_vyhledat_ekonomicke_subjekty():
+async def test_vyhledat_ekonomicke_subjekty(mocked_client):
     """Test main search functionality."""
-    client = AresApiClient()
+    client, mock_request = mocked_client
     
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = {
-            "pocetCelkem": 1,
-            "ekonomickeSubjekty": [
-                {
-                    "ico": "12345678",
-                    "obchodniJmeno": "Test Company s.r.o.",
-                    "sidlo": {
-                        "nazevUlice": "Test Street",
-                        "cisloDomovni": "123",
-                        "nazevObce": "Prague",
-                        "psc": "11000"
-                    },
-                    "pravniForma": "112",
-                    "stavSubjektu": "AKTIVNI"
-                }
-            ]
+    mock_request.return_value = _SEARCH_RESPONSE
+    
+    result = await client.vyhledat_ekonomicke_subjekty({
+        "obchodniJmeno": "Test Company",
+        "pocet": 10
+    })
+    assert isinstance(result, str)
+    result_data = loads(result)
+    
+    assert result_data["pocetCelkem"] == 1
+    assert result_data["ekonomickeSubjekty"][0]["ico"] == "12345678"
+    
+    assert mock_request.calls == [_call(
+        "POST",
+        "/ekonomicke-subjekty/vyhledat",
+        json={
+            "start": 0,
+            "pocet": 10,
+            "obchodniJmeno": "Test Company"
         }
-        
-        result = await client.vyhledat_ekonomicke_subjekty({
-            "obchodniJmeno": "Test Company",
-            "pocet": 10
+    )]
+
+
+async def test_vyhledat_stale_marker(mocked_client):
+    """Test that a stale search response keeps its stale marker."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = {**_EMPTY_SEARCH_RESPONSE, "stale": True}
+    
+    result_data = loads(await client.vyhledat_ekonomicke_subjekty({}))
+    
+    assert result_data["stale"] == True
+    
+    mock_request.return_value = _EMPTY_SEARCH_RESPONSE
+    
+    result_data = loads(await client.vyhledat_ekonomicke_subjekty({}))
+    
+    assert "stale" not in result_data
+
+
+async def test_najit_ekonomicky_subjekt(mocked_client):
+    """Test get entity by ICO."""
+    client, mock_request = mocked_client
+    
+    # Response body is passed through as raw JSON text
+    mock_request.return_value = _ENTITY_RESPONSE
+    
+    result = await client.najit_ekonomicky_subjekt("12345678")
+    
+    # The body is handed to the MCP layer without re-serializing
+    assert result == _ENTITY_RESPONSE
+    result_data = loads(result)
+    
+    assert result_data["ico"] == "12345678"
+    assert result_data["obchodniJmeno"] == "Test Company s.r.o."
+    
+    assert mock_request.calls == [
+        _call("GET", "/ekonomicke-subjekty/12345678", raw=True)
+    ]
+
+
+async def test_malformed_ico_skips_request(mocked_client):
+    """Test that malformed IČO is rejected without calling ARES."""
+    client, mock_request = mocked_client
+    
+    for result in (
+        await client.najit_ekonomicky_subjekt("1234"),
+        await client.najit_v_registru("rzp", "1234567a"),
+    ):
+        assert "8 číslic" in loads(result)["error"]
+    
+    assert mock_request.calls == []
+
+
+@pytest.mark.parametrize("ico, reason", [
+    ("123", "8 číslic"),
+    ("1234567a", "8 číslic"),
+    ("١٢٣٤٥٦٧٨", "8 číslic"),  # Non-ASCII digits are rejected as well
+    ("00000018", None),  # Invalid checksum
+    ("12345678", None),
+])
+async def test_validovat_ico_invalid(mocked_client, ico, reason):
+    """Test that invalid IČO is rejected without calling ARES."""
+    client, mock_request = mocked_client
+    
+    result_data = await client._validovat_ico(ico)
+    
+    assert result_data["valid"] == False
+    if reason is None:
+        assert result_data["validFormat"] == False
+    else:
+        assert reason in result_data["reason"]
+    assert mock_request.calls == []
+
+
+async def test_validovat_ico(mocked_client):
+    """Test IČO validation.
+    
+    Uses the dict-returning ``_validovat_ico``; serialization of the result
+    is covered by the tests going through ``validovat_ico``.
+    """
+    client, mock_request = mocked_client
+    
+    # Test valid format
+    mock_request.return_value = {"ico": "00000019"}
+    
+    result_data = await client._validovat_ico("00000019")  # Valid checksum
+    
+    assert result_data["validFormat"] == True
+    assert result_data["exists"] == True
+    assert result_data["valid"] == True
+    
+    # Not found means the IČO does not exist
+    mock_request.side_effect = AresApiError("ARES API error: HTTP 404", 404)
+    
+    result_data = await client._validovat_ico("00000019")
+    
+    assert result_data["exists"] == False
+    assert result_data["valid"] == False
+    
+    # Other API errors are reported instead of claiming non-existence
+    mock_request.side_effect = AresApiError("ARES API error: HTTP 500", 500)
+    
+    result_data = await client._validovat_ico("00000019")
+    
+    assert "HTTP 500" in result_data["error"]
+
+
+async def test_validovat_ico_hromadne(mocked_client):
+    """Test bulk IČO validation."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = '{"ico": "00000019"}'
+    
+    result = await client.validovat_ico_hromadne(["00000019", "123", "00000018"])
+    result_data = loads(result)
+    
+    assert result_data["pocetCelkem"] == 3
+    assert result_data["pocetValidnich"] == 1
+    assert [r["ico"] for r in result_data["vysledky"]] == ["00000019", "123", "00000018"]
+    assert result_data["vysledky"][2]["validFormat"] == False
+    
+    # Only the checksum-valid IČO is looked up
+    assert mock_request.calls == [
+        _call("GET", "/ekonomicke-subjekty/00000019", raw=True)
+    ]
+
+
+async def test_vyhledat_v_registru(mocked_client):
+    """Test registry-specific search."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = _REGISTRY_RESPONSE
+    
+    result = await client.vyhledat_v_registru("rzp", {
+        "obchodniJmeno": "Test"
+    })
+    assert isinstance(result, str)
+    result_data = loads(result)
+    
+    assert "registry" in result_data
+    assert result_data["registry"]["endpoint"] == "ekonomicke-subjekty-rzp"
+    assert result_data["data"]["pocetCelkem"] == 1
+    
+    assert mock_request.calls == [_call(
+        "POST",
+        "/ekonomicke-subjekty-rzp/vyhledat",
+        json={
+            "start": 0,
+            "pocet": 20,
+            "obchodniJmeno": "Test"
+        }
+    )]
+
+
+async def test_registry_shortcuts(mocked_client):
+    """Test per-registry methods bound at construction."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = {"ico": "12345678"}
+    
+    result = await client.najit_v_rzp("12345678")
+    result_data = loads(result)
+    
+    assert result_data["registry"]["endpoint"] == "ekonomicke-subjekty-rzp"
+    assert mock_request.calls == [_call("GET", "/ekonomicke-subjekty-rzp/12345678")]
+    
+    await client.vyhledat_v_vr({"obchodniJmeno": "Test"})
+    assert mock_request.calls[-1][0] == ("POST", "/ekonomicke-subjekty-vr/vyhledat")
+
+
+async def test_batched_lookups():
+    """Test that concurrent lookups are coalesced into one search."""
+    async with AresApiClient(batch_window=0.01) as client:
+        client._make_request = mock_request = _RequestStub({
+            "pocetCelkem": 1,
+            "ekonomickeSubjekty": [{"ico": "00000019", "obchodniJmeno": "Test"}]
         })
-        result_data = json.loads(result)
         
-        assert result_data["pocetCelkem"] == 1
-        assert result_data["ekonomickeSubjekty"][0]["ico"] == "12345678"
+        found, validated = await asyncio.gather(
+            client.najit_ekonomicky_subjekt("00000019"),
+            client.validovat_ico("00000027")
+        )
         
-        mock_request.assert_called_once_with(
+        assert loads(found)["obchodniJmeno"] == "Test"
+        assert loads(validated)["exists"] == False
+        assert mock_request.calls == [_call(
             "POST",
             "/ekonomicke-subjekty/vyhledat",
-            json={
-                "start": 0,
-                "pocet": 10,
-                "obchodniJmeno": "Test Company"
-            }
-        )
+            json={"start": 0, "pocet": 2, "ico": ["00000019", "00000027"]}
+        )]
 
 
-@pytest.mark.asyncio
-async def test_najit_ekonomicky_subjekt():
-    """Test get entity by ICO."""
-    client = AresApiClient()
+async def test_close_cancels_pending_batch():
+    """Test that closing the client cancels lookups waiting for a batch."""
+    async with AresApiClient(batch_window=10) as client:
+        client._make_request = mock_request = _RequestStub(_EMPTY_SEARCH_RESPONSE)
+        
+        lookup = asyncio.ensure_future(client.validovat_ico("00000019"))
+        await asyncio.sleep(0)
+        await client.close()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await lookup
+        assert client._batcher._timer is None
+        assert mock_request.calls == []
+
+
+async def test_error_handling(ares_client, monkeypatch):
+    """Test error handling."""
+    async def failing_request(*args, **kwargs):
+        raise RuntimeError("API Error")
     
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = {
-            "ico": "12345678",
-            "obchodniJmeno": "Test Company s.r.o.",
-            "sidlo": {
-                "nazevUlice": "Test Street",
-                "cisloDomovni": "123",
-                "nazevObce": "Prague"
-            }
-        }
+    monkeypatch.setattr(ares_client, "_make_request", failing_request)
+    
+    result = await ares_client.najit_ekonomicky_subjekt("12345678")
+    result_data = loads(result)
+    
+    assert "error" in result_data
+    assert "API Error" in result_data["error"]
+
+
+@pytest.mark.parametrize("ico, expected", [
+    ("12345678", ["12345678"]),
+    (["12345678", "87654321"], ["12345678", "87654321"]),
+    (("12345678", "87654321"), ["12345678", "87654321"]),
+])
+async def test_ico_array_conversion(mocked_client, ico, expected):
+    """Test that ICO is properly converted to array in search."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = _EMPTY_SEARCH_RESPONSE
+    
+    await client.vyhledat_ekonomicke_subjekty({"ico": ico})
+    
+    assert mock_request.calls[-1][1]["json"]["ico"] == expected
+
+
+async def test_address_filter(mocked_client):
+    """Test that address filter is validated and stripped of empty fields."""
+    client, mock_request = mocked_client
+    
+    mock_request.return_value = _EMPTY_SEARCH_RESPONSE
+    
+    await client.vyhledat_ekonomicke_subjekty({
+        "sidlo": {"kodObce": 554782, "textovaAdresa": None}
+    })
+    
+    call_args = mock_request.calls[-1][1]["json"]
+    assert call_args["sidlo"] == {"kodObce": 554782}
+
+
+@pytest.mark.parametrize("filters, message", [
+    ({"start": -1}, "start"),
+    ({"pocet": 201}, "pocet"),
+    ({"czNace": ["01", "02", "03", "04", "05", "06"]}, "czNace"),
+])
+async def test_search_filter_limits(mocked_client, filters, message):
+    """Test that out-of-range search filters are rejected before sending."""
+    client, mock_request = mocked_client
+    
+    with pytest.raises(ValueError, match=message):
+        await client.vyhledat_ekonomicke_subjekty(filters)
+    
+    assert mock_request.calls == []
+
+
+async def test_client_lifecycle():
+    """Test that HTTP client is created lazily and re-created after close."""
+    async with AresApiClient() as client:
+        assert client._client is None
+        http_client = client.client
+        assert client.client is http_client
+    
+    assert http_client.is_closed
+    assert client.client is not http_client
+    
+    await client.close()
+    assert client._client.is_closed
+
+
+def _json_response(status_code, payload, method="GET", url="/"):
+    """Build httpx response with JSON body for mocking the HTTP client."""
+    return httpx.Response(
+        status_code,
+        json=payload,
+        request=httpx.Request(method, AresApiClient.BASE_URL + url)
+    )
+
+
+def test_incomplete_cache_backend():
+    """Test that a backend missing interface methods cannot be created."""
+    class GetOnlyCache(CacheBackend):
+        def get(self, key, allow_stale=False, max_stale=None):
+            return None
+    
+    with pytest.raises(TypeError):
+        GetOnlyCache()
+
+
+async def test_response_cache(ares_client):
+    """Test that repeated GET lookups are served from cache."""
+    client = ares_client
+    
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.return_value = _json_response(200, {"ico": "12345678"})
         
-        result = await client.najit_ekonomicky_subjekt("12345678")
-        result_data = json.loads(result)
+        first = await client._make_request("GET", "/ekonomicke-subjekty/12345678")
+        second = await client._make_request("GET", "/ekonomicke-subjekty/12345678")
         
-        assert result_data["ico"] == "12345678"
-        assert result_data["obchodniJmeno"] == "Test Company s.r.o."
+        assert first == second == {"ico": "12345678"}
+        assert mock_http.await_count == 1
+
+
+async def test_raw_response_passthrough(ares_client):
+    """Test that raw requests return the response body unparsed."""
+    client = ares_client
+    
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.return_value = _json_response(200, {"ico": "12345678"})
         
-        mock_request.assert_called_once_with(
-            "GET",
-            "/ekonomicke-subjekty/12345678"
+        result = await client._make_request(
+            "GET", "/ekonomicke-subjekty/12345678", raw=True
         )
+        
+        assert isinstance(result, str)
+        assert loads(result) == {"ico": "12345678"}
 
 
-@pytest.mark.asyncio
-async def test_validovat_ico():
-    """Test IČO validation."""
-    client = AresApiClient()
+async def test_search_cache_ttl(ares_client):
+    """Test that search caching follows the configured TTL."""
+    async with AresApiClient(search_cache_ttl=0) as client:
+        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+            mock_http.return_value = _json_response(
+                200, {"pocetCelkem": 0, "ekonomickeSubjekty": []}, method="POST"
+            )
+            
+            await client.vyhledat_ekonomicke_subjekty({"obchodniJmeno": "Test"})
+            await client.vyhledat_ekonomicke_subjekty({"obchodniJmeno": "Test"})
+            
+            # TTL 0 disables caching of searches
+            assert mock_http.await_count == 2
     
-    # Test invalid format
-    result = await client.validovat_ico("123")
-    result_data = json.loads(result)
-    assert result_data["valid"] == False
-    assert "8 číslic" in result_data["reason"]
+    client = ares_client
     
-    # Test valid format
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = {"ico": "00000019"}
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.return_value = _json_response(
+            200, {"pocetCelkem": 0, "ekonomickeSubjekty": []}, method="POST"
+        )
         
-        result = await client.validovat_ico("00000019")  # Valid checksum
-        result_data = json.loads(result)
+        await client.vyhledat_ekonomicke_subjekty({"obchodniJmeno": "Test"})
+        await client.vyhledat_ekonomicke_subjekty({"obchodniJmeno": "Test"})
         
-        assert result_data["validFormat"] == True
-        assert result_data["exists"] == True
-        assert result_data["valid"] == True
+        assert mock_http.await_count == 1
 
 
-@pytest.mark.asyncio
-async def test_vyhledat_v_registru():
-    """Test registry-specific search."""
-    client = AresApiClient()
+async def test_concurrent_requests_single_flight(ares_client):
+    """Test that concurrent identical requests share one upstream call."""
+    client = ares_client
     
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = {
-            "pocetCelkem": 1,
-            "ekonomickeSubjekty": [{"ico": "12345678"}]
-        }
-        
-        result = await client.vyhledat_v_registru("rzp", {
-            "obchodniJmeno": "Test"
-        })
-        result_data = json.loads(result)
+    async def slow_request(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return _json_response(200, {"ico": "12345678"})
+    
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.side_effect = slow_request
         
-        assert "registry" in result_data
-        assert result_data["registry"]["endpoint"] == "ekonomicke-subjekty-rzp"
-        assert result_data["data"]["pocetCelkem"] == 1
+        results = await asyncio.gather(*(
+            client._make_request("GET", "/ekonomicke-subjekty/12345678")
+            for _ in range(5)
+        ))
         
-        mock_request.assert_called_once_with(
-            "POST",
-            "/ekonomicke-subjekty-rzp/vyhledat",
-            json={
-                "start": 0,
-                "pocet": 20,
-                "obchodniJmeno": "Test"
-            }
-        )
+        assert all(result == {"ico": "12345678"} for result in results)
+        assert mock_http.await_count == 1
+        assert client._inflight == {}
 
 
-@pytest.mark.asyncio
-async def test_error_handling():
-    """Test error handling."""
-    client = AresApiClient()
+async def test_validovat_ico_cached(ares_client):
+    """Test that repeated validation of same IČO hits ARES only once."""
+    client = ares_client
     
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = Exception("API Error")
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.return_value = _json_response(200, {"ico": "00000019"})
         
-        result = await client.najit_ekonomicky_subjekt("12345678")
-        result_data = json.loads(result)
+        first = await client.validovat_ico("00000019")
+        second = await client.validovat_ico("00000019")
         
-        assert "error" in result_data
-        assert "API Error" in result_data["error"]
+        assert first == second
+        assert loads(first)["valid"] == True
+        assert mock_http.await_count == 1
 
 
-@pytest.mark.asyncio
-async def test_ico_array_conversion():
-    """Test that ICO is properly converted to array in search."""
-    client = AresApiClient()
+async def test_stale_response_on_server_error():
+    """Test that last cached response is served when ARES fails."""
+    async with AresApiClient() as client:
+        client.CACHE_TTL_LOOKUP = 0.01
+        client.MAX_RETRIES = 0
+        
+        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+            mock_http.return_value = _json_response(200, {"ico": "12345678"})
+            await client._make_request("GET", "/ekonomicke-subjekty/12345678")
+            await asyncio.sleep(0.02)
+            
+            mock_http.return_value = _json_response(503, {"detail": "Unavailable"})
+            result = await client._make_request("GET", "/ekonomicke-subjekty/12345678")
+            
+            assert result == {"ico": "12345678", "stale": True}
+            assert mock_http.await_count == 2
+
+
+async def test_stale_raw_response_is_marked():
+    """Test that stale raw responses carry the stale marker as well."""
+    async with AresApiClient() as client:
+        client.CACHE_TTL_LOOKUP = 0.01
+        client.MAX_RETRIES = 0
+        
+        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+            mock_http.return_value = _json_response(200, {"ico": "00000019"})
+            await client.najit_ekonomicky_subjekt("00000019")
+            await asyncio.sleep(0.02)
+            
+            mock_http.return_value = _json_response(503, {"detail": "Unavailable"})
+            result = await client.najit_ekonomicky_subjekt("00000019")
+            
+            assert loads(result) == {"ico": "00000019", "stale": True}
+            
+            # Responses expired for longer than MAX_STALE_AGE are not served
+            client.MAX_STALE_AGE = 0
+            result = await client.najit_ekonomicky_subjekt("00000019")
+            
+            assert "HTTP 503" in loads(result)["error"]
+
+
+@pytest.mark.parametrize("payload", ["bad detail value", 5, ["detail"]])
+async def test_non_object_error_body(ares_client, payload):
+    """Test that JSON error bodies which are not objects keep the status."""
+    client = ares_client
     
-    with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = {"pocetCelkem": 0, "ekonomickeSubjekty": []}
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http:
+        mock_http.return_value = _json_response(400, payload)
         
-        # Test single ICO string
-        await client.vyhledat_ekonomicke_subjekty({"ico": "12345678"})
+        with pytest.raises(AresApiError) as exc_info:
+            await client._make_request("GET", "/ekonomicke-subjekty/12345678")
         
-        call_args = mock_request.call_args[1]["json"]
-        assert call_args["ico"] == ["12345678"]
+        assert exc_info.value.status_code == 400
+
+
+async def test_retry_on_throttling(ares_client):
+    """Test that 429 responses are retried honoring Retry-After."""
+    client = ares_client
+    
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_http, \
+            patch("ares_mcp_server.api_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        throttled = _json_response(429, {"detail": "Too many requests"})
+        throttled.headers["Retry-After"] = "2"
+        mock_http.side_effect = [throttled, _json_response(200, {"ico": "12345678"})]
         
-        # Test ICO array
-        await client.vyhledat_ekonomicke_subjekty({"ico": ["12345678", "87654321"]})
+        result = await client._make_request("GET", "/ekonomicke-subjekty/12345678")
         
-        call_args = mock_request.call_args[1]["json"]
-        assert call_args["ico"] == ["12345678", "87654321"]
+        assert result == {"ico": "12345678"}
+        assert mock_http.await_count == 2
+        mock_sleep.assert_awaited_once_with(2.0)
 
 
 if __name__ == "__main__":
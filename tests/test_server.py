@@ -0,0 +1,83 @@
+"""Tests for ARES MCP server."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ares_mcp_server import __version__
+from ares_mcp_server.api_client import AresApiClient
+from ares_mcp_server.server import AresMcpServer
+
+
+@pytest.fixture
+async def server():
+    """Server with its own API client, closed after the test."""
+    async with AresApiClient() as client:
+        yield AresMcpServer(api_client=client)
+
+
+async def _call_tool(server, name, arguments):
+    """Run tool call through the registered MCP request handler."""
+    handler = server.server.request_handlers[CallToolRequest]
+    result = await handler(CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments)
+    ))
+    return result.root
+
+
+def test_initialization_options(server):
+    """Test that initialization advertises the version and tool support."""
+    options = server.server.create_initialization_options()
+    
+    assert options.server_name == "ares-mcp-server"
+    assert options.server_version == __version__
+    assert options.capabilities.tools is not None
+
+
+async def test_call_tool_result(server):
+    """Test that tool results are returned as a single text part."""
+    with patch.object(server.api_client, 'validovat_ico', new_callable=AsyncMock) as mock_tool:
+        mock_tool.return_value = '{"valid": true}'
+        
+        result = await _call_tool(server, "validovat_ico", {"ico": "00000019"})
+        
+        assert not result.isError
+        assert [content.text for content in result.content] == ['{"valid": true}']
+        mock_tool.assert_awaited_once_with(ico="00000019")
+
+
+async def test_call_tool_missing_arguments(server, monkeypatch):
+    """Test that missing required arguments are reported before dispatch."""
+    # Without listed tools the MCP SDK skips schema validation, leaving
+    # the server's own required-argument check
+    monkeypatch.setattr("ares_mcp_server.server.create_ares_tools", lambda: [])
+    
+    with patch.object(server.api_client, 'najit_v_registru', new_callable=AsyncMock) as mock_tool:
+        result = await _call_tool(server, "najit_v_registru", {"registry": "rzp"})
+        
+        assert result.content[0].text == "Error: Missing required arguments: ico"
+        mock_tool.assert_not_awaited()
+
+
+async def test_call_tool_keeps_arguments(server):
+    """Test that registry search does not mutate the tool arguments."""
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="vyhledat_v_registru",
+            arguments={"registry": "rzp", "obchodniJmeno": "Test"}
+        )
+    )
+    
+    with patch.object(server.api_client, 'vyhledat_v_registru', new_callable=AsyncMock) as mock_tool:
+        mock_tool.return_value = "{}"
+        
+        await server.server.request_handlers[CallToolRequest](request)
+        
+        mock_tool.assert_awaited_once_with(
+            registry="rzp", filters={"obchodniJmeno": "Test"}
+        )
+        # The handler receives the request's own arguments dict
+        assert request.params.arguments == {"registry": "rzp", "obchodniJmeno": "Test"}